@@ -1,11 +1,15 @@
-from setuptools import find_packages, setup
+from functools import lru_cache
 
+from setuptools import setup
 
+
+@lru_cache(maxsize=1)
 def find_required():
     with open("requirements.txt") as f:
         return f.read().splitlines()
 
 
+@lru_cache(maxsize=1)
 def find_dev_required():
     with open("requirements-dev.txt") as f:
         return f.read().splitlines()
@@ -27,7 +31,7 @@ setup(
         "GitHub": "https://github.com/vedro-universe/vedro-pw",
     },
     license="Apache-2.0",
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=["vedro_pw"],
     package_data={"vedro_pw": ["py.typed"]},
     install_requires=find_required(),
     tests_require=find_dev_required(),
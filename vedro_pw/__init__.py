@@ -1,15 +1,60 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from ._capture_mode import CaptureMode
 from ._pw_browser import PlaywrightBrowser
-from ._pw_plugin import Playwright, PlaywrightPlugin
-from .async_api import (
-    created_browser_context,
-    launched_browser,
-    launched_local_browser,
-    launched_remote_browser,
-    opened_browser_page,
-)
+
+if TYPE_CHECKING:
+    from ._pw_plugin import Playwright as Playwright
+    from ._pw_plugin import PlaywrightPlugin as PlaywrightPlugin
+    from .async_api import created_browser_context as created_browser_context
+    from .async_api import launched_browser as launched_browser
+    from .async_api import launched_local_browser as launched_local_browser
+    from .async_api import launched_remote_browser as launched_remote_browser
+    from .async_api import opened_browser_page as opened_browser_page
+    from .async_api import prewarm as prewarm
 
 __version__ = "0.2.1"
 __all__ = ("opened_browser_page", "created_browser_context", "launched_browser",
-           "launched_local_browser", "launched_remote_browser",
+           "launched_local_browser", "launched_remote_browser", "prewarm",
            "Playwright", "PlaywrightPlugin", "PlaywrightBrowser", "CaptureMode",)
+
+_LAZY_ATTRS = {
+    "Playwright": "._pw_plugin",
+    "PlaywrightPlugin": "._pw_plugin",
+    "launched_browser": ".async_api",
+    "launched_local_browser": ".async_api",
+    "launched_remote_browser": ".async_api",
+    "created_browser_context": ".async_api",
+    "opened_browser_page": ".async_api",
+    "prewarm": ".async_api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily exported attributes on first access (PEP 562).
+
+    The plugin and browser helpers pull in `playwright.async_api`, a heavy
+    transitive import graph. Deferring those imports keeps `import vedro_pw`
+    cheap for code that only needs the enums.
+
+    :param name: The name of the attribute to resolve.
+    :return: The resolved attribute value.
+    :raises AttributeError: If the attribute is not exported by the package.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package attributes, including the lazily exported ones.
+
+    :return: A sorted list of attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -25,4 +25,4 @@ class CaptureMode(str, Enum):
 
         :return: The string value of the CaptureMode.
         """
-        return self.value
+        return str.__str__(self)
@@ -1,11 +1,12 @@
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from playwright.async_api import Browser, BrowserContext, Page
 from vedro import defer
 
-from ._runtime_config import RuntimeConfig
+from ._runtime_config import RuntimeConfig, context_pooling_enabled
 from ._runtime_config import runtime_config as _runtime_config
-from .options import DeviceOptions
+from .options import DeviceOptions, normalize_paths
 
 __all__ = ("ConfigurableBrowser",)
 
@@ -31,6 +32,9 @@ class ConfigurableBrowser(Browser):
         super().__init__(impl_obj._impl_obj)
         self._runtime_config = runtime_config
         self._device_options = device_options or {}
+        # Checked by `created_browser_context` instead of an isinstance call
+        # to decide whether the context close is already deferred here.
+        self._defers_context_close = True
 
     async def new_context(self, **kwargs: Any) -> BrowserContext:
         """
@@ -42,36 +46,75 @@ class ConfigurableBrowser(Browser):
         :param kwargs: Additional options to override or extend the context settings.
         :return: A new `BrowserContext` instance with the configured options.
         """
-        options = {
-            **self._device_options,
-            **kwargs
-        }
+        # Snapshot the runtime config into a local once: the method reads half a
+        # dozen of its attributes and locals are cheaper than attribute chains.
+        runtime_config = self._runtime_config
 
-        if self._runtime_config.should_capture_video:
-            video_options = self._runtime_config.video_options
-            options["record_video_dir"] = video_options["record_video_dir"]
+        options = dict(self._device_options)
+        options.update(kwargs)
 
-        context = await super().new_context(**options)
-        defer(context.close)
-        defer(self._runtime_config.remove_browser_context, context)
+        if runtime_config.should_capture_video:
+            options["record_video_dir"] = runtime_config.video_options["record_video_dir"]
 
-        default_timeout = self._runtime_config.timeout
+        context = await super().new_context(**normalize_paths(options))
+
+        default_timeout = runtime_config.timeout
         if default_timeout is not None:
             context.set_default_timeout(default_timeout)
-        navigation_timeout = self._runtime_config.navigation_timeout
+        navigation_timeout = runtime_config.navigation_timeout
         if navigation_timeout is not None:
             context.set_default_navigation_timeout(navigation_timeout)
 
-        if self._runtime_config.should_capture_trace:
-            trace_options = self._runtime_config.trace_options
+        trace_path: Union[Path, str, None] = None
+        if runtime_config.should_capture_trace:
+            trace_options = runtime_config.trace_options
             await context.tracing.start(screenshots=trace_options["screenshots"],
                                         snapshots=trace_options["snapshots"])
-            defer(context.tracing.stop, path=trace_options["path"])
+            trace_path = trace_options["path"]
 
-        self._runtime_config.add_browser_context(context)
+        # Only a plain default-shaped context may be recycled: explicit kwargs
+        # (storage state, HAR recording, viewport, ...) make it scenario-specific.
+        defer(self._cleanup_context, context, trace_path, not kwargs)
+        runtime_config.add_browser_context(context)
 
         return context
 
+    async def _cleanup_context(self, context: BrowserContext,
+                               trace_path: Union[Path, str, None] = None,
+                               poolable: bool = False) -> None:
+        """
+        Tear down a browser context created by `new_context`.
+
+        Runs the whole teardown as a single deferred callback instead of three:
+        the trace is stopped first (if tracing was started), then the context is
+        removed from the runtime registry, and finally the context is closed —
+        the same order the separate defer callbacks used to run in.
+
+        :param context: The browser context to tear down.
+        :param trace_path: The path to save the captured trace to, if tracing
+                           was started for this context.
+        :param poolable: Whether the context was created with default options
+                         and may be recycled instead of closed.
+        """
+        if trace_path is not None:
+            await context.tracing.stop(path=trace_path)
+        runtime_config = self._runtime_config
+        if (poolable and trace_path is None and not runtime_config.should_capture_video
+                and context_pooling_enabled()):
+            # Nothing needs a close to flush, so reset the context and hand it
+            # back to the pool instead of destroying it; release_context also
+            # untracks it.
+            await runtime_config.release_context(context)
+            return
+        if runtime_config.should_capture_video and context.pages:
+            # Remember where the recording ended up so the plugin can pick it
+            # up directly instead of scanning the video directory afterwards.
+            video = context.pages[0].video
+            if video is not None:
+                runtime_config.last_video_path = Path(await video.path())
+        runtime_config.remove_browser_context(context)
+        await context.close()
+
     async def new_page(self, **kwargs: Any) -> Page:
         """
         Create a new browser page within a newly created context.
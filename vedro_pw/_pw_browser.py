@@ -29,4 +29,4 @@ class PlaywrightBrowser(str, Enum):
 
         :return: The string value of the browser type.
         """
-        return self.value
+        return str.__str__(self)
@@ -1,10 +1,13 @@
+import asyncio
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Type, Union
+from typing import Any, Dict, List, NamedTuple, Tuple, Type, Union
+from uuid import uuid4
 
-from playwright.async_api import Page
 from vedro import FileArtifact, create_tmp_dir, create_tmp_file
-from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.core import Dispatcher, Event, Plugin, PluginConfig, StepResult
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -21,9 +24,157 @@ from ._pw_browser import PlaywrightBrowser
 from ._runtime_config import RuntimeConfig
 from ._runtime_config import runtime_config as _runtime_config
 from ._utils import show_pw_trace
+from .options import ScreenshotOptions
 
 __all__ = ("Playwright", "PlaywrightPlugin",)
 
+# Zero-padded step prefixes for screenshot file names, precomputed so the step
+# hook concatenates ready-made strings instead of re-running the f-string
+# format machinery for every captured page.
+_STEP_PREFIXES = tuple(f"step{i:02}_" for i in range(1, 100))
+
+
+# Precomputed argparse choices and cached string-to-enum converters: argparse
+# re-runs the converter (and iterates choices) for defaults, parsing, and help
+# rendering, so the lookup machinery is paid for at most once per value.
+_BROWSER_CHOICES = tuple(PlaywrightBrowser)
+_CAPTURE_CHOICES = tuple(CaptureMode)
+_browser_from_str = lru_cache(maxsize=8)(PlaywrightBrowser)
+_capture_mode_from_str = lru_cache(maxsize=8)(CaptureMode)
+
+# Characters that are unsafe in file names; runs of them are collapsed to a
+# single underscore when step names are embedded into screenshot prefixes.
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+# Mode groupings used when deriving _CaptureFlags: frozenset membership is a
+# single hash lookup and avoids building a fresh tuple for each test.
+_ALWAYS_OR_FAILURE = frozenset({CaptureMode.ALWAYS, CaptureMode.ON_FAILURE})
+_ALWAYS_OR_RESCHEDULE = frozenset({CaptureMode.ALWAYS, CaptureMode.ON_RESCHEDULE})
+
+
+def _bulk_unlink(paths: List[Path]) -> None:
+    """
+    Delete the given files, ignoring ones that are already gone.
+
+    :param paths: The paths of the files to delete.
+    """
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _create_tmp_files(prefixes: List[str], suffix: str) -> List[Path]:
+    """
+    Create a batch of temporary files with the given prefixes.
+
+    :param prefixes: The file name prefixes, one per file to create.
+    :param suffix: The file name suffix shared by all created files.
+    :return: The paths of the created files, in prefix order.
+    """
+    return [create_tmp_file(prefix=prefix, suffix=suffix) for prefix in prefixes]
+
+
+class _CaptureFlags(NamedTuple):
+    """
+    Holds the capture and retention decisions derived from a CaptureMode.
+
+    The capture mode for each artifact kind is fixed once arguments are parsed,
+    so the per-scenario decisions reduce to plain boolean reads instead of enum
+    membership tests repeated in every hook.
+    """
+
+    capture_always: bool
+    capture_on_reschedule: bool
+    retain_always: bool
+    retain_on_failure: bool
+
+    @classmethod
+    def from_mode(cls, capture_mode: CaptureMode) -> "_CaptureFlags":
+        """
+        Derive the capture and retention flags from the given capture mode.
+
+        :param capture_mode: The mode specifying when to capture and retain the artifact.
+        :return: The precomputed flags for the mode.
+        """
+        return cls(
+            capture_always=capture_mode in _ALWAYS_OR_FAILURE,
+            capture_on_reschedule=capture_mode is CaptureMode.ON_RESCHEDULE,
+            retain_always=capture_mode in _ALWAYS_OR_RESCHEDULE,
+            retain_on_failure=capture_mode is CaptureMode.ON_FAILURE,
+        )
+
+    def should_capture(self, is_rescheduled: bool) -> bool:
+        """
+        Determine if the artifact should be captured for the current scenario.
+
+        :param is_rescheduled: Whether the scenario has been rescheduled.
+        :return: True if the artifact should be captured, False otherwise.
+        """
+        return self.capture_always or (self.capture_on_reschedule and is_rescheduled)
+
+    def should_retain(self, is_failed: bool) -> bool:
+        """
+        Determine if a captured artifact should be retained.
+
+        :param is_failed: Whether the scenario or step has failed.
+        :return: True if the artifact should be retained, False otherwise.
+        """
+        return self.retain_always or (self.retain_on_failure and is_failed)
+
+
+# CaptureMode has four members and the derived flags never change, so the full
+# mode-to-flags mapping is materialized once; call sites do a dict lookup
+# instead of re-deriving the flags.
+_CAPTURE_TABLE = {mode: _CaptureFlags.from_mode(mode) for mode in CaptureMode}
+
+
+class _ConfigSnapshot(NamedTuple):
+    """
+    Holds the plugin settings read from a Playwright config class.
+
+    The attribute walk over the config class is cached per class, so repeated
+    plugin instantiations (e.g. during test collection) unpack one tuple
+    instead of re-reading over a dozen class attributes each time.
+    """
+
+    browser: PlaywrightBrowser
+    device: Union[str, None]
+    headed: bool
+    slowmo: int
+    remote: bool
+    remote_endpoint: str
+    capture_screenshots: CaptureMode
+    screenshot_options: ScreenshotOptions
+    capture_video: CaptureMode
+    capture_trace: CaptureMode
+    timeout: Union[int, None]
+    navigation_timeout: Union[int, None]
+    browser_timeout: Union[int, None]
+
+
+@lru_cache(maxsize=None)
+def _config_snapshot(config: Type["Playwright"]) -> _ConfigSnapshot:
+    """
+    Snapshot the settings of the given config class.
+
+    :param config: The Playwright configuration class.
+    :return: The cached snapshot for the class.
+    """
+    return _ConfigSnapshot(
+        browser=config.browser,
+        device=config.device,
+        headed=config.headed,
+        slowmo=config.slowmo,
+        remote=config.remote,
+        remote_endpoint=config.remote_endpoint,
+        capture_screenshots=config.capture_screenshots,
+        screenshot_options=config.screenshot_options,
+        capture_video=config.capture_video,
+        capture_trace=config.capture_trace,
+        timeout=config.timeout,
+        navigation_timeout=config.navigation_timeout,
+        browser_timeout=config.browser_timeout,
+    )
+
 
 class PlaywrightPlugin(Plugin):
     """
@@ -44,27 +195,51 @@ class PlaywrightPlugin(Plugin):
         """
         super().__init__(config)
         self._runtime_config = runtime_config
-        self._browser: PlaywrightBrowser = config.browser
-        self._device: Union[str, None] = config.device
-        self._headed: bool = config.headed
-        self._slowmo: int = config.slowmo
-
-        self._remote: bool = config.remote
-        self._remote_endpoint: str = config.remote_endpoint
-
-        self._capture_screenshots: CaptureMode = config.capture_screenshots
-        self._capture_video: CaptureMode = config.capture_video
-        self._capture_trace: CaptureMode = config.capture_trace
+        snapshot = _config_snapshot(config)
+        self._browser: PlaywrightBrowser = snapshot.browser
+        self._device: Union[str, None] = snapshot.device
+        self._headed: bool = snapshot.headed
+        self._slowmo: int = snapshot.slowmo
+
+        self._remote: bool = snapshot.remote
+        self._remote_endpoint: str = snapshot.remote_endpoint
+
+        self._capture_screenshots: CaptureMode = snapshot.capture_screenshots
+        self._screenshot_options: ScreenshotOptions = snapshot.screenshot_options
+        self._capture_video: CaptureMode = snapshot.capture_video
+        self._capture_trace: CaptureMode = snapshot.capture_trace
+        self._screenshot_flags = _CAPTURE_TABLE[self._capture_screenshots]
+        self._video_flags = _CAPTURE_TABLE[self._capture_video]
+        self._trace_flags = _CAPTURE_TABLE[self._capture_trace]
         self._open_last_trace: bool = False
 
-        self._timeout: Union[int, None] = config.timeout
-        self._navigation_timeout: Union[int, None] = config.navigation_timeout
-        self._browser_timeout: Union[int, None] = config.browser_timeout
+        self._timeout: Union[int, None] = snapshot.timeout
+        self._navigation_timeout: Union[int, None] = snapshot.navigation_timeout
+        self._browser_timeout: Union[int, None] = snapshot.browser_timeout
 
+        self._screenshots_enabled: bool = False
         self._prev_scenario_id: Union[str, None] = None
+        self._trace_dir: Union[Path, None] = None
         self._captured_trace: Union[Path, None] = None
+        self._video_root: Union[Path, None] = None
+        self._video_seq: int = 0
         self._captured_video: Union[Path, None] = None
-        self._captured_screenshots: Dict[str, Path] = {}
+        self._captured_screenshots: List[Tuple[StepResult, Path]] = []
+        self._pending_deletions: List[Path] = []
+        self._arg_specs = self._build_arg_specs()
+
+    # The event subscriptions registered by `subscribe`, kept as data so new
+    # events extend the tuple instead of adding another chained method call.
+    _SUBSCRIPTIONS: Tuple[Tuple[Type[Event], str], ...] = (
+        (ArgParseEvent, "on_arg_parse"),
+        (ArgParsedEvent, "on_arg_parsed"),
+        (ScenarioRunEvent, "on_scenario_run"),
+        (StepPassedEvent, "on_step_end"),
+        (StepFailedEvent, "on_step_end"),
+        (ScenarioPassedEvent, "on_scenario_end"),
+        (ScenarioFailedEvent, "on_scenario_end"),
+        (CleanupEvent, "on_cleanup"),
+    )
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
@@ -72,14 +247,66 @@ class PlaywrightPlugin(Plugin):
 
         :param dispatcher: The event dispatcher to register listeners on.
         """
-        dispatcher.listen(ArgParseEvent, self.on_arg_parse) \
-                  .listen(ArgParsedEvent, self.on_arg_parsed) \
-                  .listen(ScenarioRunEvent, self.on_scenario_run) \
-                  .listen(StepPassedEvent, self.on_step_end) \
-                  .listen(StepFailedEvent, self.on_step_end) \
-                  .listen(ScenarioPassedEvent, self.on_scenario_end) \
-                  .listen(ScenarioFailedEvent, self.on_scenario_end) \
-                  .listen(CleanupEvent, self.on_cleanup)
+        listen = dispatcher.listen
+        for event_class, handler_name in self._SUBSCRIPTIONS:
+            listen(event_class, getattr(self, handler_name))
+
+    def _build_arg_specs(self) -> List[Tuple[str, bool, Dict[str, Any]]]:
+        """
+        Build the Playwright argument definitions once.
+
+        The help strings interpolate defaults that are fixed at init time, so
+        the specs are precomputed here and replayed by `on_arg_parse` instead
+        of being rebuilt imperatively on every argument-parse event.
+
+        :return: A list of (flag, is_mode_flag, add_argument kwargs) tuples, where
+                 mode flags go into the mutually exclusive headed/headless group.
+        """
+        return [
+            ("--pw-browser", False,
+             dict(action="store", type=_browser_from_str, choices=_BROWSER_CHOICES,
+                  default=self._browser,
+                  help=f"Specify the browser to use (default: {self._browser})")),
+            ("--pw-slowmo", False,
+             dict(action="store", type=int, default=self._slowmo,
+                  help=("Slow down Playwright operations by the specified milliseconds "
+                        f"(default: {self._slowmo})"))),
+            ("--pw-headed", True,
+             dict(action="store_true", default=None,
+                  help=f"Run the browser in headed mode (default: {self._headed})")),
+            ("--pw-headless", True,
+             dict(action="store_true", default=None,
+                  help=f"Run the browser in headless mode (default: {not self._headed})")),
+            ("--pw-remote", False,
+             dict(action="store_true", default=self._remote,
+                  help=f"Connect to a remote browser instance (default: {self._remote})")),
+            ("--pw-remote-endpoint", False,
+             dict(action="store", default=self._remote_endpoint,
+                  help=("WebSocket endpoint URL for the remote browser "
+                        f"(default: {self._remote_endpoint})"))),
+            ("--pw-screenshots", False,
+             dict(action="store", type=_capture_mode_from_str, choices=_CAPTURE_CHOICES,
+                  default=self._capture_screenshots,
+                  help=("Control screenshot capturing behavior "
+                        f"(default: {self._capture_screenshots})"))),
+            ("--pw-video", False,
+             dict(action="store", type=_capture_mode_from_str, choices=_CAPTURE_CHOICES,
+                  default=self._capture_video,
+                  help=f"Control video recording behavior default ({self._capture_video})")),
+            ("--pw-trace", False,
+             dict(action="store", type=_capture_mode_from_str, choices=_CAPTURE_CHOICES,
+                  default=self._capture_trace,
+                  help=f"Control trace recording behavior (default: {self._capture_trace})")),
+            ("--pw-device", False,
+             dict(action="store", default=self._device,
+                  help="Emulate a specific device (e.g., 'iPhone 15 Pro' or 'Pixel 7')")),
+            ("--pw-debug", False,
+             dict(action="store_true", default=False,
+                  help="Enable Playwright debug mode by setting PWDEBUG=1")),
+            ("--pw-open-last-trace", False,
+             dict(action="store_true", default=self._open_last_trace,
+                  help="Open the most recent Playwright trace (if available)")),
+        ]
 
     def on_arg_parse(self, event: ArgParseEvent) -> None:
         """
@@ -90,53 +317,11 @@ class PlaywrightPlugin(Plugin):
         :param event: The ArgParseEvent instance containing the argument parser.
         """
         group = event.arg_parser.add_argument_group("Playwright")
-
-        group.add_argument("--pw-browser", action="store",
-                           type=PlaywrightBrowser, choices=PlaywrightBrowser,
-                           default=self._browser,
-                           help=f"Specify the browser to use (default: {self._browser})")
-        group.add_argument("--pw-slowmo", action="store", type=int, default=self._slowmo,
-                           help=("Slow down Playwright operations by the specified milliseconds "
-                                 f"(default: {self._slowmo})"))
-
         mode_group = group.add_mutually_exclusive_group()
-        mode_group.add_argument("--pw-headed", action="store_true", default=None,
-                                help=f"Run the browser in headed mode (default: {self._headed})")
-        mode_group.add_argument("--pw-headless", action="store_true", default=None,
-                                help=("Run the browser in headless mode "
-                                      f"(default: {not self._headed})"))
-
-        group.add_argument("--pw-remote", action="store_true", default=self._remote,
-                           help=f"Connect to a remote browser instance (default: {self._remote})")
-        group.add_argument("--pw-remote-endpoint", action="store", default=self._remote_endpoint,
-                           help=("WebSocket endpoint URL for the remote browser "
-                                 f"(default: {self._remote_endpoint})"))
-
-        group.add_argument("--pw-screenshots", action="store",
-                           type=CaptureMode, choices=CaptureMode,
-                           default=self._capture_screenshots,
-                           help=("Control screenshot capturing behavior "
-                                 f"(default: {self._capture_screenshots})"))
-        group.add_argument("--pw-video", action="store",
-                           type=CaptureMode, choices=CaptureMode,
-                           default=self._capture_video,
-                           help=("Control video recording behavior default "
-                                 f"({self._capture_video})"))
-        group.add_argument("--pw-trace", action="store",
-                           type=CaptureMode, choices=CaptureMode,
-                           default=self._capture_trace,
-                           help=("Control trace recording behavior "
-                                 f"(default: {self._capture_trace})"))
-
-        group.add_argument("--pw-device", action="store", default=self._device,
-                           help="Emulate a specific device (e.g., 'iPhone 15 Pro' or 'Pixel 7')")
-
-        group.add_argument("--pw-debug", action="store_true", default=False,
-                           help="Enable Playwright debug mode by setting PWDEBUG=1")
-
-        group.add_argument("--pw-open-last-trace", action="store_true",
-                           default=self._open_last_trace,
-                           help="Open the most recent Playwright trace (if available)")
+
+        for flag, is_mode_flag, kwargs in self._arg_specs:
+            target = mode_group if is_mode_flag else group
+            target.add_argument(flag, **kwargs)
 
     def on_arg_parsed(self, event: ArgParsedEvent) -> None:
         """
@@ -147,29 +332,39 @@ class PlaywrightPlugin(Plugin):
         :param event: The ArgParsedEvent instance containing parsed arguments.
         :raises ValueError: If the `--pw-slowmo` value is negative.
         """
+        runtime_config = self._runtime_config
+
         if event.args.pw_headless is not None:
-            self._runtime_config.headed = False
+            headed = False
         elif event.args.pw_headed is not None:
-            self._runtime_config.headed = True
+            headed = True
         else:
-            self._runtime_config.headed = self._headed
-
-        self._runtime_config.browser_name = event.args.pw_browser
-        self._runtime_config.device_name = event.args.pw_device
+            headed = self._headed
 
         slomo = event.args.pw_slowmo
         if slomo < 0:
             raise ValueError("Slowmo must be a non-negative integer")
-        self._runtime_config.slowmo = slomo
 
-        self._runtime_config.remote = event.args.pw_remote
-        self._runtime_config.remote_endpoint = event.args.pw_remote_endpoint
+        # All parsed values are applied through one bulk setter call instead
+        # of a dozen sequential attribute writes.
+        config_updates: Dict[str, Any] = {
+            "headed": headed,
+            "browser_name": event.args.pw_browser,
+            "device_name": event.args.pw_device,
+            "slowmo": slomo,
+            "remote": event.args.pw_remote,
+            "remote_endpoint": event.args.pw_remote_endpoint,
+            "screenshot_options": self._screenshot_options,
+        }
 
         self._capture_screenshots = event.args.pw_screenshots
         self._capture_video = event.args.pw_video
         self._capture_trace = event.args.pw_trace
+        self._screenshot_flags = _CAPTURE_TABLE[self._capture_screenshots]
+        self._video_flags = _CAPTURE_TABLE[self._capture_video]
+        self._trace_flags = _CAPTURE_TABLE[self._capture_trace]
 
-        if self._runtime_config.remote and self._capture_video != CaptureMode.NEVER:
+        if event.args.pw_remote and self._capture_video != CaptureMode.NEVER:
             print("Playwright cannot capture video when using a remote browser for some reason")
 
         if event.args.pw_debug:
@@ -178,11 +373,13 @@ class PlaywrightPlugin(Plugin):
         self._open_last_trace = event.args.pw_open_last_trace
 
         if self._timeout is not None:
-            self._runtime_config.timeout = self._timeout
+            config_updates["timeout"] = self._timeout
         if self._navigation_timeout is not None:
-            self._runtime_config.navigation_timeout = self._navigation_timeout
+            config_updates["navigation_timeout"] = self._navigation_timeout
         if self._browser_timeout is not None:
-            self._runtime_config.browser_timeout = self._browser_timeout
+            config_updates["browser_timeout"] = self._browser_timeout
+
+        runtime_config.update(**config_updates)
 
     async def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         """
@@ -195,11 +392,22 @@ class PlaywrightPlugin(Plugin):
         is_rescheduled = (event.scenario_result.scenario.unique_id == self._prev_scenario_id)
         self._prev_scenario_id = event.scenario_result.scenario.unique_id
 
+        # Resolve all three capture decisions up front so each runtime config
+        # field is written exactly once, instead of a False write that is
+        # immediately overwritten on the capture path.
+        capture_trace = self._trace_flags.should_capture(is_rescheduled)
+        capture_video = self._video_flags.should_capture(is_rescheduled)
+        capture_screenshots = self._screenshot_flags.should_capture(is_rescheduled)
+
         self._captured_trace = None
-        self._runtime_config.should_capture_trace = False
-        if self._should_capture(self._capture_trace, is_rescheduled):
-            self._runtime_config.should_capture_trace = True
-            self._captured_trace = create_tmp_file(prefix="pw_trace_", suffix=".zip")
+        self._runtime_config.should_capture_trace = capture_trace
+        if capture_trace:
+            # Playwright creates the trace file itself when tracing stops, so
+            # only a unique path is needed here: one tmp dir per run plus a
+            # uuid-based name skips the mkstemp open/close dance per scenario.
+            if self._trace_dir is None:
+                self._trace_dir = create_tmp_dir(prefix="pw_traces_")
+            self._captured_trace = self._trace_dir / f"pw_trace_{uuid4().hex}.zip"
             self._runtime_config.trace_options = {
                 "path": self._captured_trace,
                 "screenshots": True,
@@ -207,49 +415,24 @@ class PlaywrightPlugin(Plugin):
             }
 
         self._captured_video = None
-        self._runtime_config.should_capture_video = False
-        if self._should_capture(self._capture_video, is_rescheduled):
-            self._runtime_config.should_capture_video = True
-            self._captured_video = create_tmp_dir(prefix="pw_video_")
+        self._runtime_config.last_video_path = None
+        self._runtime_config.should_capture_video = capture_video
+        if capture_video:
+            # One tmp dir is created per run; each scenario records into its
+            # own subdirectory (Playwright creates it on demand), avoiding a
+            # mkdtemp syscall round-trip per scenario.
+            if self._video_root is None:
+                self._video_root = create_tmp_dir(prefix="pw_video_")
+            self._video_seq += 1
+            self._captured_video = self._video_root / f"scenario_{self._video_seq}"
             self._runtime_config.video_options = {
                 "record_video_dir": self._captured_video,
                 # "record_video_size": None,
             }
 
-        self._captured_screenshots = {}
-        self._runtime_config.should_capture_screenshots = (
-            self._should_capture(self._capture_screenshots, is_rescheduled)
-        )
-
-    def _should_capture(self, capture_mode: CaptureMode, is_rescheduled: bool) -> bool:
-        """
-        Determine if an artifact should be captured based on the capture mode.
-
-        :param capture_mode: The mode specifying when to capture the artifact.
-        :param is_rescheduled: Whether the scenario has been rescheduled.
-        :return: True if the artifact should be captured, False otherwise.
-        """
-        if capture_mode in (CaptureMode.ALWAYS, CaptureMode.ON_FAILURE):
-            return True
-        elif capture_mode == CaptureMode.ON_RESCHEDULE and is_rescheduled:
-            return True
-        else:
-            return False
-
-    def _should_retain(self, capture_mode: CaptureMode, is_failed: bool) -> bool:
-        """
-        Determine if a captured artifact should be retained based on the capture mode.
-
-        :param capture_mode: The mode specifying when to retain the artifact.
-        :param is_failed: Whether the scenario or step has failed.
-        :return: True if the artifact should be retained, False otherwise.
-        """
-        if capture_mode in (CaptureMode.ALWAYS, CaptureMode.ON_RESCHEDULE):
-            return True
-        elif capture_mode == CaptureMode.ON_FAILURE and is_failed:
-            return True
-        else:
-            return False
+        self._captured_screenshots = []
+        self._screenshots_enabled = capture_screenshots
+        self._runtime_config.should_capture_screenshots = capture_screenshots
 
     async def on_step_end(self, event: Union[StepPassedEvent, StepFailedEvent]) -> None:
         """
@@ -259,38 +442,57 @@ class PlaywrightPlugin(Plugin):
 
         :param event: The StepPassedEvent or StepFailedEvent instance.
         """
-        if not self._runtime_config.should_capture_screenshots:
+        if not self._screenshots_enabled:
+            return
+        if not self._runtime_config.browser_contexts:
             return
 
-        step_name = event.step_result.step.name
-        for context in self._runtime_config.get_browser_contexts():
-            for page in context.pages:
-                try:
-                    screenshot_path = await self._capture_screenshot(page, step_name)
-                except Exception as e:
-                    event.step_result.add_extra_details(f"Failed to capture screenshot: {e!r}")
-                else:
-                    self._captured_screenshots[step_name] = screenshot_path
-
-    async def _capture_screenshot(self, page: Page, step_name: str) -> Path:
-        """
-        Capture a screenshot of the current browser page and save it to a temporary file.
-
-        This method generates a unique file name based on the step number and step name,
-        saves the screenshot to a temporary file, and returns the file path.
-
-        :param page: The Playwright `Page` instance to capture the screenshot from.
-        :param step_name: The name of the step, used in the screenshot file name.
-        :return: The path to the temporary file where the screenshot is saved.
-        :raises playwright.async_api.Error: If the screenshot capture fails.
-        """
-        screenshot_number = len(self._captured_screenshots) + 1
-        prefix = f"step{screenshot_number:02}_{step_name}_"
-        screenshot_path = create_tmp_file(prefix=prefix, suffix=".png")
-
-        await page.screenshot(path=screenshot_path)
+        step_result = event.step_result
+        step_name = step_result.step.name
+        captured_screenshots = self._captured_screenshots
+        pages = [page for context in self._runtime_config.get_browser_contexts()
+                 for page in context.pages]
+        if not pages:
+            return
 
-        return screenshot_path
+        # Pre-allocate the target paths so the numbering stays deterministic,
+        # then let all page screenshots progress concurrently: they are
+        # I/O-bound round-trips over the driver pipe, so serializing them
+        # wastes wall time proportional to the number of open pages.
+        screenshot_options = self._runtime_config.screenshot_options
+        suffix = ".jpg" if screenshot_options.get("type") == "jpeg" else ".png"
+
+        safe_step_name = _NON_WORD_RE.sub("_", step_name)
+        prefixes: List[str] = []
+        for page in pages:
+            screenshot_number = len(captured_screenshots) + len(prefixes) + 1
+            if screenshot_number <= len(_STEP_PREFIXES):
+                prefixes.append(_STEP_PREFIXES[screenshot_number - 1] + safe_step_name + "_")
+            else:
+                prefixes.append(f"step{screenshot_number:02}_{safe_step_name}_")
+
+        # The mkstemp calls are blocking file-system work; batch them into one
+        # executor hop so the event loop is not stalled once per page.
+        loop = asyncio.get_running_loop()
+        paths = await loop.run_in_executor(None, _create_tmp_files, prefixes, suffix)
+        jobs = list(zip(pages, paths))
+
+        def per_page_options(path: Path) -> ScreenshotOptions:
+            # The target path is always generated here, overriding any
+            # configured one; a typed per-page copy keeps the splat checked.
+            options = screenshot_options.copy()
+            options["path"] = path
+            return options
+
+        results = await asyncio.gather(
+            *(page.screenshot(**per_page_options(path)) for page, path in jobs),
+            return_exceptions=True)
+        for (_, screenshot_path), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                step_result.add_extra_details(f"Failed to capture screenshot: {result!r}")
+                screenshot_path.unlink(missing_ok=True)
+            else:
+                captured_screenshots.append((step_result, screenshot_path))
 
     async def on_scenario_end(self,
                               event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
@@ -301,31 +503,49 @@ class PlaywrightPlugin(Plugin):
 
         :param event: The ScenarioPassedEvent or ScenarioFailedEvent instance.
         """
-        is_failed = isinstance(event, ScenarioFailedEvent)
+        if (self._captured_trace is None and self._captured_video is None
+                and not self._captured_screenshots):
+            return
 
-        if self._captured_trace:
-            if self._should_retain(self._capture_trace, is_failed):
+        is_failed = type(event) is ScenarioFailedEvent
+        scenario_result = event.scenario_result
+        # Discarded artifacts are queued up and deleted in one batch at
+        # cleanup: each unlink is a blocking syscall, and doing them inline
+        # would stall the event loop between scenarios.
+        to_delete = self._pending_deletions
+
+        # The trace file only materializes once a context actually starts
+        # tracing; a scenario that never opened a browser has the path but no
+        # file, and attaching that would fail the artifact save.
+        if self._captured_trace is not None and self._captured_trace.exists():
+            if self._trace_flags.should_retain(is_failed):
                 trace_artifact = self._create_trace_artifact(self._captured_trace)
-                event.scenario_result.attach(trace_artifact)
+                scenario_result.attach(trace_artifact)
             else:
-                self._captured_trace.unlink(missing_ok=True)
+                to_delete.append(self._captured_trace)
 
-        captured_video = self._find_file(self._captured_video)
+        # The context teardown records the video path when it closes; falling
+        # back to a directory scan covers contexts closed by other means.
+        captured_video = self._runtime_config.last_video_path
+        if captured_video is None:
+            captured_video = self._find_file(self._captured_video)
         if captured_video:
-            if self._should_retain(self._capture_video, is_failed):
+            if self._video_flags.should_retain(is_failed):
                 video_artifact = self._create_video_artifact(captured_video)
-                event.scenario_result.attach(video_artifact)
-            else:
-                captured_video.unlink(missing_ok=True)
-
-        step_results = {x.step.name: x for x in event.scenario_result.step_results}
-        for step_name, screenshot in self._captured_screenshots.items():
-            if self._should_retain(self._capture_screenshots, is_failed):
-                screenshot_artifact = self._create_screenshot_artifact(screenshot)
-                step_result = step_results.get(step_name, event.scenario_result)
-                step_result.attach(screenshot_artifact)
+                scenario_result.attach(video_artifact)
             else:
-                screenshot.unlink(missing_ok=True)
+                to_delete.append(captured_video)
+
+        if not self._captured_screenshots:
+            return
+        if self._screenshot_flags.should_retain(is_failed):
+            # Each screenshot is recorded together with the StepResult it was
+            # captured for, so attaching is a direct call -- no name-to-result
+            # mapping has to be rebuilt from scenario_result.step_results.
+            for step_result, screenshot in self._captured_screenshots:
+                step_result.attach(self._create_screenshot_artifact(screenshot))
+        else:
+            to_delete.extend(screenshot for _, screenshot in self._captured_screenshots)
 
     def _find_file(self, directory: Union[Path, None]) -> Union[Path, None]:
         """
@@ -335,9 +555,12 @@ class PlaywrightPlugin(Plugin):
         :return: The Path to the first file, or None if no files are found.
         """
         if directory and directory.is_dir():
-            for file in directory.iterdir():
-                if file.is_file():
-                    return file
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # With follow_symlinks=False the check is answered from the
+                    # DirEntry d_type cache, avoiding a stat call per entry.
+                    if entry.is_file(follow_symlinks=False):
+                        return Path(entry.path)
         return None
 
     def _create_trace_artifact(self, trace_path: Path) -> FileArtifact:
@@ -365,17 +588,25 @@ class PlaywrightPlugin(Plugin):
         :param screenshot_path: The Path to the screenshot file.
         :return: A FileArtifact representing the screenshot.
         """
-        return FileArtifact(screenshot_path.name, "image/png", screenshot_path)
+        mime_type = "image/jpeg" if screenshot_path.suffix in (".jpg", ".jpeg") else "image/png"
+        return FileArtifact(screenshot_path.name, mime_type, screenshot_path)
 
-    def on_cleanup(self, event: CleanupEvent) -> None:
+    async def on_cleanup(self, event: CleanupEvent) -> None:
         """
         Handle the cleanup event to finalize the Playwright test session.
 
-        If the `--pw-open-last-trace` option is enabled and a trace was captured,
-        this method attempts to open the Playwright trace viewer for the last captured trace.
+        Flushes the queue of discarded artifact files in a single background
+        deletion batch. If the `--pw-open-last-trace` option is enabled and a
+        trace was captured, this method also attempts to open the Playwright
+        trace viewer for the last captured trace.
 
         :param event: The CleanupEvent instance triggered during cleanup.
         """
+        if self._pending_deletions:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _bulk_unlink, self._pending_deletions)
+            self._pending_deletions = []
+
         if not self._open_last_trace:
             return
 
@@ -433,6 +664,12 @@ class Playwright(PluginConfig):
     # Docs: https://playwright.dev/python/docs/screenshots
     capture_screenshots: CaptureMode = CaptureMode.NEVER
 
+    # Options passed to `page.screenshot()` for captured screenshots.
+    # For example, {"type": "jpeg", "quality": 70} trades image fidelity for
+    # much faster encoding and smaller files on screenshot-heavy runs.
+    # Docs: https://playwright.dev/python/docs/api/class-page#page-screenshot
+    screenshot_options: ScreenshotOptions = ScreenshotOptions()
+
     # Controls whether videos of the browser session are recorded.
     # Docs: https://playwright.dev/python/docs/videos
     capture_video: CaptureMode = CaptureMode.NEVER
@@ -1,12 +1,31 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+from weakref import WeakSet
 
 from playwright.async_api import BrowserContext
 
 from ._pw_browser import PlaywrightBrowser
 from .options import ScreenshotOptions, TraceOptions, VideoOptions
 
-__all__ = ("RuntimeConfig", "runtime_config",)
+# `runtime_config` is provided lazily by the module-level `__getattr__` below.
+__all__ = ("RuntimeConfig", "runtime_config", "get_runtime_config",  # noqa: F822
+           "context_pooling_enabled",)
+
+
+def context_pooling_enabled() -> bool:
+    """
+    Check whether browser contexts should be pooled and reused across scenarios.
+
+    Pooling is opt-in via the `VEDRO_PW_REUSE_CONTEXT` environment variable:
+    a reused context keeps browser-level state such as init scripts, so it is
+    only safe for suites that run every scenario against one browser setup.
+
+    :return: True if contexts should be pooled, False otherwise.
+    """
+    return os.environ.get("VEDRO_PW_REUSE_CONTEXT", "").lower() not in ("", "0", "false")
 
 
 @dataclass
@@ -65,9 +84,25 @@ class RuntimeConfig:
     Timeout (in milliseconds) for launching the browser.
     """
 
-    browser_contexts: Dict[Any, Any] = field(default_factory=dict)
+    browser_contexts: "WeakSet[BrowserContext]" = field(default_factory=WeakSet)
+    """
+    Tracks active browser contexts. Held weakly so contexts are reclaimed as soon
+    as Playwright drops them, even if a scenario crashes before cleanup runs.
+    """
+
+    _close_listened: "WeakSet[BrowserContext]" = field(default_factory=WeakSet)
+    """
+    Contexts that already carry the close listener registered by
+    `add_browser_context`, so re-adding a pooled context does not stack
+    another listener on every lease.
+    """
+
+    context_pool: List[BrowserContext] = field(default_factory=list)
     """
-    Tracks active browser contexts as a dictionary where the keys are context instances.
+    Idle browser contexts available for reuse. Creating a context costs tens to
+    hundreds of milliseconds, so recycling one (leased by
+    `created_browser_context`, returned via `release_context`) turns the
+    per-scenario work into a cookie/permission reset.
     """
 
     should_capture_trace: bool = False
@@ -75,7 +110,7 @@ class RuntimeConfig:
     Indicates whether to enable trace recording during browser sessions.
     """
 
-    trace_options: TraceOptions = field(default_factory=lambda: TraceOptions())
+    trace_options: TraceOptions = field(default_factory=TraceOptions)
     """
     Configuration options for trace recording, including file paths, names, and captured data.
     """
@@ -85,17 +120,23 @@ class RuntimeConfig:
     Indicates whether video recording should be enabled for browser sessions.
     """
 
-    video_options: VideoOptions = field(default_factory=lambda: VideoOptions())
+    video_options: VideoOptions = field(default_factory=VideoOptions)
     """
     Configuration options for video recording, such as file formats and storage paths.
     """
 
+    last_video_path: Optional[Path] = None
+    """
+    The path of the most recently recorded video, tracked when its browser context
+    closes so the video directory does not have to be scanned afterwards.
+    """
+
     should_capture_screenshots: bool = False
     """
     Indicates whether screenshots should be captured during browser sessions.
     """
 
-    screenshot_options: ScreenshotOptions = field(default_factory=lambda: ScreenshotOptions())
+    screenshot_options: ScreenshotOptions = field(default_factory=ScreenshotOptions)
     """
     Configuration options for screenshot capturing, including format, quality, and storage paths.
     """
@@ -106,7 +147,15 @@ class RuntimeConfig:
 
         :param context: The browser context to add.
         """
-        self.browser_contexts[context] = ...
+        self.browser_contexts.add(context)
+        # Drop the context from tracking the moment it closes, regardless of
+        # which teardown path closed it; the explicit remove_browser_context
+        # call stays as a safety net. Registered once per context: Playwright
+        # keeps every on() callback, and pooled contexts are re-added here on
+        # each lease.
+        if context not in self._close_listened:
+            self._close_listened.add(context)
+            context.on("close", self.browser_contexts.discard)
 
     def remove_browser_context(self, context: BrowserContext) -> None:
         """
@@ -114,15 +163,103 @@ class RuntimeConfig:
 
         :param context: The browser context to remove.
         """
-        self.browser_contexts.pop(context, None)
+        self.browser_contexts.discard(context)
+
+    def get_browser_contexts(self) -> Iterable[BrowserContext]:
+        """
+        Retrieve the active browser contexts.
+
+        :return: An iterable of active browser contexts. A snapshot is returned
+                 because the weak set can shrink during garbage collection.
+        """
+        return list(self.browser_contexts)
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """
+        Return a browser context to the pool for reuse.
+
+        The context is reset before being pooled: leftover pages are closed
+        and cookies and granted permissions are cleared, so the next lease
+        starts from a blank slate. The context is also dropped from the
+        active registry — an idle pooled context must not show up in
+        screenshot sweeps of later scenarios. While video capture is enabled
+        the context is closed instead, so the recording gets flushed.
 
-    def get_browser_contexts(self) -> List[BrowserContext]:
+        :param context: The browser context to release.
         """
-        Retrieve the list of active browser contexts.
+        if self.should_capture_video:
+            await context.close()
+            return
+        self.remove_browser_context(context)
+        for page in list(context.pages):
+            await page.close()
+        await context.clear_cookies()
+        await context.clear_permissions()
+        self.context_pool.append(context)
 
-        :return: A list of active browser contexts.
+    def update(self, **kwargs: Any) -> None:
         """
-        return list(self.browser_contexts.keys())
+        Assign several configuration fields in one call.
 
+        Collapses a series of per-field attribute writes into a single method
+        frame; unknown names are rejected before anything is assigned.
 
-runtime_config = RuntimeConfig()
+        :param kwargs: Field names and the values to assign to them.
+        :raises KeyError: If a name does not match a RuntimeConfig field.
+        """
+        unknown = kwargs.keys() - _CONFIG_FIELDS
+        if unknown:
+            raise KeyError(f"Unknown RuntimeConfig fields: {sorted(unknown)}")
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+
+# Valid field names for `RuntimeConfig.update`, derived once from the dataclass.
+_CONFIG_FIELDS = frozenset(f.name for f in fields(RuntimeConfig))
+
+_runtime_config_var: ContextVar[RuntimeConfig] = ContextVar("vedro_pw_runtime_config")
+
+
+def _default_runtime_config() -> RuntimeConfig:
+    """
+    Return the process-wide default RuntimeConfig, creating it on first use.
+
+    :return: The default RuntimeConfig instance.
+    """
+    instance: Optional[RuntimeConfig] = globals().get("runtime_config")
+    if instance is None:
+        instance = globals()["runtime_config"] = RuntimeConfig()
+    return instance
+
+
+def get_runtime_config() -> RuntimeConfig:
+    """
+    Return the runtime configuration for the current execution context.
+
+    The config is stored in a ContextVar so future parallel scenario execution
+    can give each worker its own isolated instance without locking; the default
+    is the module-level singleton, preserving today's single-worker behavior.
+
+    :return: The active RuntimeConfig instance.
+    """
+    config = _runtime_config_var.get(None)
+    if config is None:
+        config = _default_runtime_config()
+    return config
+
+
+def __getattr__(name: str) -> RuntimeConfig:
+    """
+    Create the module-level `runtime_config` singleton on first access (PEP 562).
+
+    Constructing RuntimeConfig eagerly at import time allocates its option
+    dicts and tracking collections even for consumers that only want the
+    class; deferring it keeps the import cheap.
+
+    :param name: The name of the attribute to resolve.
+    :return: The default RuntimeConfig instance.
+    :raises AttributeError: If the attribute is not exported by the module.
+    """
+    if name == "runtime_config":
+        return _default_runtime_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
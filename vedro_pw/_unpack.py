@@ -5,20 +5,22 @@ This module ensures that the `Unpack` type hint is available regardless of wheth
 available in the `typing` module (for newer Python versions) or needs to be imported from
 `typing_extensions`. If neither is available, it defines a fallback for `Unpack`.
 """
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing_extensions import Unpack
+elif sys.version_info >= (3, 11):
+    # `Unpack` landed in `typing` in 3.11; the version check avoids paying for
+    # a raised-and-caught ImportError on older interpreters.
+    from typing import Unpack
 else:
     try:
-        from typing import Unpack
+        from typing_extensions import Unpack
     except ImportError:
-        try:
-            from typing_extensions import Unpack
-        except ImportError:
-            from typing import Any, TypeVar, Union
-            _T = TypeVar("_T")
-            Unpack = Union[_T, Any]
+        from typing import Any, TypeVar, Union
+        _T = TypeVar("_T")
+        Unpack = Union[_T, Any]
 
 
 __all__ = ("Unpack",)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from random import choice
 from typing import Union, cast
@@ -10,6 +11,18 @@ from .options import DeviceOptions
 
 __all__ = ("get_browser_type", "get_device_options", "show_pw_trace",)
 
+# Concrete browser names eligible for PlaywrightBrowser.RANDOM, hoisted so the
+# pool is not rebuilt from the enum on every browser acquisition.
+_NON_RANDOM_BROWSERS = tuple(x.value for x in PlaywrightBrowser
+                             if x is not PlaywrightBrowser.RANDOM)
+_RANDOM_BROWSER = PlaywrightBrowser.RANDOM.value
+
+# Resolved lazily by `show_pw_trace` so repeated invocations skip the PATH scan.
+_pw_bin: Union[str, None] = None
+
+_DEVICE_DOCS_URL = ("https://github.com/microsoft/playwright/blob/main/"
+                    "packages/playwright-core/src/server/deviceDescriptorsSource.json")
+
 
 def get_browser_type(playwright: AsyncPlaywright,
                      browser_name: Union[PlaywrightBrowser, str]) -> BrowserType:
@@ -25,12 +38,13 @@ def get_browser_type(playwright: AsyncPlaywright,
     :return: The `BrowserType` instance for the specified browser.
     :raises AttributeError: If the specified browser is not available in the Playwright instance.
     """
-    if isinstance(browser_name, PlaywrightBrowser):
+    # PlaywrightBrowser is final in practice, so an exact type check replaces
+    # the isinstance MRO walk; the RANDOM test then compares plain strings.
+    if type(browser_name) is PlaywrightBrowser:
         browser_name = browser_name.value
 
-    if browser_name == PlaywrightBrowser.RANDOM:
-        browser_name = choice([x.value for x in PlaywrightBrowser
-                               if x != PlaywrightBrowser.RANDOM])
+    if browser_name == _RANDOM_BROWSER:
+        browser_name = choice(_NON_RANDOM_BROWSERS)
 
     return cast(BrowserType, getattr(playwright, browser_name))
 
@@ -58,8 +72,7 @@ def get_device_options(playwright: AsyncPlaywright,
     if device_options is None:
         raise ValueError(
             f"Device '{device_name}' is not supported or does not exist. "
-            "Please refer to the list of supported devices here: "
-            "https://github.com/microsoft/playwright/blob/main/packages/playwright-core/src/server/deviceDescriptorsSource.json"  # noqa
+            f"Please refer to the list of supported devices here: {_DEVICE_DOCS_URL}"
         )
     return cast(DeviceOptions, device_options)
 
@@ -74,9 +87,35 @@ def show_pw_trace(path: Path) -> None:
 
     :param path: The file path to the trace file to be opened.
     """
+    global _pw_bin
+    if _pw_bin is None:
+        import shutil
+        _pw_bin = shutil.which("playwright") or "playwright"
+
+    args = [_pw_bin, "show-trace", str(path)]
+
+    # posix_spawn skips the copy-on-write page-table duplication a fork would
+    # do for this (potentially large) process. It needs a resolved executable
+    # path, so fall through to Popen when the PATH lookup failed or the
+    # platform lacks the primitive.
+    if hasattr(os, "posix_spawn") and os.path.sep in _pw_bin:
+        try:
+            os.posix_spawn(
+                _pw_bin, args, dict(os.environ),
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0o644),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0o644),
+                ],
+                setsid=True,
+            )
+        except (OSError, NotImplementedError):
+            pass
+        else:
+            return
+
     import subprocess
     subprocess.Popen(
-        args=["playwright", "show-trace", str(path)],
+        args=args,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
         start_new_session=True
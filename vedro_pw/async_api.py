@@ -1,19 +1,28 @@
-from typing import Any, Dict, Optional, Union, overload
+import asyncio
+import os
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple, Union, overload
 
-from playwright.async_api import Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, BrowserType, Page
 from playwright.async_api import Playwright as AsyncPlaywright
 from playwright.async_api import async_playwright
-from vedro import defer
+from vedro import defer, defer_global
 
 from ._configurable_browser import ConfigurableBrowser
 from ._pw_browser import PlaywrightBrowser
-from ._runtime_config import runtime_config as _runtime_config
+from ._runtime_config import context_pooling_enabled, get_runtime_config
 from ._unpack import Unpack
 from ._utils import get_browser_type, get_device_options
-from .options import ConnectOptions, LaunchOptions, NewContextOptions
+from .options import (
+    ConnectOptions,
+    LaunchOptions,
+    NewContextOptions,
+    freeze_options,
+    normalize_paths,
+)
 
 __all__ = ("launched_browser", "launched_local_browser", "launched_remote_browser",
-           "created_browser_context", "opened_browser_page",)
+           "created_browser_context", "opened_browser_page", "prewarm",)
 
 
 @overload
@@ -22,7 +31,7 @@ async def launched_browser(browser_name: Optional[Union[PlaywrightBrowser, str]]
                            *,
                            auto_close: bool = True,
                            playwright: Optional[AsyncPlaywright] = None,
-                           **kwargs: LaunchOptions) -> ConfigurableBrowser:
+                           **kwargs: Unpack[LaunchOptions]) -> ConfigurableBrowser:
     """
     Launch a local browser instance.
 
@@ -42,7 +51,7 @@ async def launched_browser(browser_name: Optional[Union[PlaywrightBrowser, str]]
                            *,
                            auto_close: bool = True,
                            playwright: Optional[AsyncPlaywright] = None,
-                           **kwargs: ConnectOptions) -> ConfigurableBrowser:
+                           **kwargs: Unpack[ConnectOptions]) -> ConfigurableBrowser:
     """
     Connect to a remote browser instance.
 
@@ -72,16 +81,11 @@ async def launched_browser(browser_name: Optional[Union[PlaywrightBrowser, str]]
     :param kwargs: Additional options for the browser.
     :return: A ConfigurableBrowser instance.
     """
-    if _runtime_config.remote:
-        return await launched_remote_browser(browser_name, device_name,
-                                             auto_close=auto_close,
-                                             playwright=playwright,
-                                             **kwargs)
-    else:
-        return await launched_local_browser(browser_name, device_name,
-                                            auto_close=auto_close,
-                                            playwright=playwright,
-                                            **kwargs)
+    launcher = launched_remote_browser if get_runtime_config().remote else launched_local_browser
+    return await launcher(browser_name, device_name,
+                          auto_close=auto_close,
+                          playwright=playwright,
+                          **kwargs)
 
 
 async def launched_local_browser(browser_name: Optional[Union[PlaywrightBrowser, str]] = None,
@@ -89,7 +93,7 @@ async def launched_local_browser(browser_name: Optional[Union[PlaywrightBrowser,
                                  *,
                                  auto_close: bool = True,
                                  playwright: Optional[AsyncPlaywright] = None,
-                                 **kwargs: LaunchOptions) -> ConfigurableBrowser:
+                                 **kwargs: Unpack[LaunchOptions]) -> ConfigurableBrowser:
     """
     Launch a local browser instance.
 
@@ -103,20 +107,30 @@ async def launched_local_browser(browser_name: Optional[Union[PlaywrightBrowser,
     if playwright is None:
         playwright = await _get_playwright_instance()
 
-    options: Dict[str, Any] = {
-        **kwargs,
-        "headless": kwargs.get("headless", not _runtime_config.headed),
-        "slow_mo": kwargs.get("slow_mo", _runtime_config.slowmo),
-    }
-    if timeout := kwargs.get("timeout", _runtime_config.browser_timeout):
-        options["timeout"] = timeout
-
-    browser_type = get_browser_type(playwright, browser_name or _runtime_config.browser_name)
-    browser_instance = await browser_type.launch(**options)
-    if auto_close:
-        defer(browser_instance.close)
+    runtime_config = get_runtime_config()
+    # Fill the defaults into a single dict copy: the splat-and-get variant
+    # allocated a second dict and looked every defaulted key up twice.
+    options: Dict[str, Any] = dict(kwargs)
+    options.setdefault("headless", not runtime_config.headed)
+    options.setdefault("slow_mo", runtime_config.slowmo)
+    if "timeout" not in options and runtime_config.browser_timeout:
+        options["timeout"] = runtime_config.browser_timeout
+    normalize_paths(options)
+
+    browser_type = get_browser_type(playwright, browser_name or runtime_config.browser_name)
+    if _is_browser_reused():
+        pool_key = (browser_type.name, freeze_options(options))
+        browser_instance = _browser_pool.get(pool_key)
+        if browser_instance is None or not browser_instance.is_connected():
+            browser_instance = await browser_type.launch(**options)
+            _browser_pool[pool_key] = browser_instance
+            defer_global(browser_instance.close)
+    else:
+        browser_instance = await browser_type.launch(**options)
+        if auto_close:
+            defer(browser_instance.close)
 
-    device_options = get_device_options(playwright, device_name or _runtime_config.device_name)
+    device_options = get_device_options(playwright, device_name or runtime_config.device_name)
     return ConfigurableBrowser(browser_instance, device_options=device_options)
 
 
@@ -125,7 +139,7 @@ async def launched_remote_browser(browser_name: Optional[Union[PlaywrightBrowser
                                   *,
                                   auto_close: bool = True,
                                   playwright: Optional[AsyncPlaywright] = None,
-                                  **kwargs: ConnectOptions) -> ConfigurableBrowser:
+                                  **kwargs: Unpack[ConnectOptions]) -> ConfigurableBrowser:
     """
     Connect to a remote browser instance.
 
@@ -139,21 +153,53 @@ async def launched_remote_browser(browser_name: Optional[Union[PlaywrightBrowser
     if playwright is None:
         playwright = await _get_playwright_instance(auto_close=auto_close)
 
-    options: Dict[str, Any] = {
-        **kwargs,
-        "ws_endpoint": kwargs.get("ws_endpoint", _runtime_config.remote_endpoint),
-        "slow_mo": kwargs.get("slow_mo", _runtime_config.slowmo),
-    }
-
-    browser_type = get_browser_type(playwright, browser_name or _runtime_config.browser_name)
-    browser_instance = await browser_type.connect(**options)
-    if auto_close:
-        defer(browser_instance.close)
+    runtime_config = get_runtime_config()
+    options: Dict[str, Any] = dict(kwargs)
+    prefer_cdp = options.pop("prefer_cdp", False)
+    options.setdefault("ws_endpoint", runtime_config.remote_endpoint)
+    options.setdefault("slow_mo", runtime_config.slowmo)
+
+    browser_type = get_browser_type(playwright, browser_name or runtime_config.browser_name)
+    if _is_browser_reused():
+        # CDP endpoints accept many clients, so one connection per endpoint is
+        # reused for the whole run instead of paying the WebSocket handshake
+        # and protocol negotiation per scenario; reconnect only if it dropped.
+        ws_endpoint = options["ws_endpoint"]
+        browser_instance = _remote_browsers.get(ws_endpoint)
+        if browser_instance is None or not browser_instance.is_connected():
+            browser_instance = await _connect_remote(browser_type, options, prefer_cdp)
+            _remote_browsers[ws_endpoint] = browser_instance
+            defer_global(browser_instance.close)
+    else:
+        browser_instance = await _connect_remote(browser_type, options, prefer_cdp)
+        if auto_close:
+            defer(browser_instance.close)
 
-    device_options = get_device_options(playwright, device_name or _runtime_config.device_name)
+    device_options = get_device_options(playwright, device_name or runtime_config.device_name)
     return ConfigurableBrowser(browser_instance, device_options=device_options)
 
 
+async def _connect_remote(browser_type: BrowserType, options: Dict[str, Any],
+                          prefer_cdp: bool) -> Browser:
+    """
+    Connect to a remote browser over the configured protocol.
+
+    `connect_over_cdp` attaches straight to the DevTools endpoint without the
+    Playwright-protocol session setup, making reconnects lighter; it only
+    works against Chromium endpoints, so it is opt-in via `prefer_cdp`.
+
+    :param browser_type: The browser type to connect through.
+    :param options: The connect options; `ws_endpoint` names the endpoint.
+    :param prefer_cdp: Whether to connect over CDP instead of the Playwright protocol.
+    :return: The connected Browser instance.
+    """
+    if prefer_cdp:
+        cdp_options = dict(options)
+        endpoint_url = cdp_options.pop("ws_endpoint")
+        return await browser_type.connect_over_cdp(endpoint_url, **cdp_options)
+    return await browser_type.connect(**options)
+
+
 async def created_browser_context(browser: Optional[Browser] = None,
                                   **kwargs: Unpack[NewContextOptions]) -> BrowserContext:
     """
@@ -163,6 +209,22 @@ async def created_browser_context(browser: Optional[Browser] = None,
     :param kwargs: Additional options for creating the browser context.
     :return: A BrowserContext instance.
     """
+    # With context pooling enabled, a reset context from a previous scenario
+    # is leased instead of creating a fresh one. Only the plain-default shape
+    # is poolable: explicit kwargs (storage state, HAR/video recording, ...)
+    # demand a dedicated context, and capture modes need a close to flush.
+    # The pool is consulted before launching anything, so a warm hit skips
+    # the browser lookup entirely.
+    runtime_config = get_runtime_config()
+    if (not kwargs and context_pooling_enabled()
+            and not runtime_config.should_capture_video
+            and not runtime_config.should_capture_trace):
+        pooled = _pop_pooled_context(runtime_config.context_pool, browser)
+        if pooled is not None:
+            runtime_config.add_browser_context(pooled)
+            defer(runtime_config.release_context, pooled)
+            return pooled
+
     if browser is None:
         browser = await launched_browser()
 
@@ -174,37 +236,164 @@ async def created_browser_context(browser: Optional[Browser] = None,
     # via `.launch()` and pass it to `created_browser_context`. In such cases, if `defer` is not
     # applied, the context might not close properly, leading to unsaved artifacts and potential
     # debugging difficulties due to the time taken to trace missing resources.
-    if not isinstance(browser, ConfigurableBrowser):
+    # The flag is set by `ConfigurableBrowser.__init__`; reading it is cheaper than an
+    # isinstance check on every scenario.
+    if not getattr(browser, "_defers_context_close", False):
         defer(context.close)
 
     return context
 
 
+async def prewarm(browser_name: Optional[Union[PlaywrightBrowser, str]] = None,
+                  **kwargs: Unpack[LaunchOptions]) -> None:
+    """
+    Launch a browser ahead of time so the first scenario skips the cold start.
+
+    Meant to be awaited once at suite startup, with browser reuse enabled via
+    `VEDRO_PW_REUSE_BROWSER`: the launched instance lands in the run-wide
+    pool, so the first `launched_browser()` call with matching options gets a
+    warm hit instead of paying the browser startup (~1-3 s for Chromium).
+    Without reuse enabled this is a no-op beyond starting Playwright itself.
+
+    :param browser_name: The name of the browser to warm up.
+    :param kwargs: Launch options; must match the ones the scenarios will use,
+                   because they are part of the pool key.
+    """
+    if _is_browser_reused():
+        await launched_local_browser(browser_name, auto_close=False, **kwargs)
+    elif _is_playwright_shared():
+        # Still worth starting the shared Playwright driver early.
+        await _get_playwright_instance()
+
+
+# The context implicitly created for the current scenario, so repeated
+# `opened_browser_page()` calls within one scenario share it instead of
+# paying `new_context` again per page.
+_scenario_context: ContextVar[Optional[BrowserContext]] = ContextVar(
+    "vedro_pw_scenario_context", default=None)
+
+
+def _pop_pooled_context(pool: List[BrowserContext],
+                        browser: Optional[Browser]) -> Optional[BrowserContext]:
+    """
+    Pop a live pooled context, optionally pinned to a specific browser.
+
+    Scans newest-first and drops contexts whose browser has disconnected
+    (a non-pooled browser closes at scenario end, after its context was
+    released). When a browser is given, only its own contexts qualify;
+    ConfigurableBrowser is a fresh wrapper around the driver-side object,
+    so affinity is checked on the underlying impl.
+
+    :param pool: The idle-context pool to take from.
+    :param browser: The browser the leased context must belong to, if any.
+    :return: A pooled context whose browser is still connected, or None.
+    """
+    for index in range(len(pool) - 1, -1, -1):
+        context = pool[index]
+        context_browser = context.browser
+        if context_browser is None or not context_browser.is_connected():
+            del pool[index]
+            continue
+        if browser is None or context_browser._impl_obj is browser._impl_obj:
+            del pool[index]
+            return context
+    return None
+
+
 async def opened_browser_page(context: Optional[BrowserContext] = None) -> Page:
     """
     Open a new page in the given browser context.
 
-    :param context: An optional BrowserContext instance. If None, a context is created.
+    When no context is given, the context created for the first page of the
+    scenario is reused for subsequent pages; it is created on demand and
+    cleaned up with the scenario as before.
+
+    :param context: An optional BrowserContext instance. If None, the
+                    scenario-scoped context is used, created if necessary.
     :return: A Page instance representing the new browser page.
     """
     if context is None:
-        context = await created_browser_context()
+        context = _scenario_context.get()
+        if context is None:
+            context = await created_browser_context()
+            _scenario_context.set(context)
+            # Forget the context at scenario end, alongside the deferred
+            # close registered by created_browser_context.
+            defer(_scenario_context.set, None)
 
     page = await context.new_page()
 
     return page
 
 
+_browser_pool: Dict[Tuple[str, Any], Browser] = {}
+# Remote connections reused across scenarios, keyed by websocket endpoint.
+_remote_browsers: Dict[str, Browser] = {}
+
+
+def _is_browser_reused() -> bool:
+    """
+    Check whether launched browsers should be pooled and reused across scenarios.
+
+    Browser launch costs hundreds of milliseconds to seconds per scenario;
+    with pooling only the browser context is created and disposed per
+    scenario. Reuse is opt-in via the `VEDRO_PW_REUSE_BROWSER` environment
+    variable because a pooled browser stays open until the end of the run.
+
+    :return: True if launched browsers should be reused, False otherwise.
+    """
+    return os.environ.get("VEDRO_PW_REUSE_BROWSER", "").lower() not in ("", "0", "false")
+
+
+_shared_playwright: Optional[AsyncPlaywright] = None
+# Created lazily inside a running loop: instantiating asyncio primitives at
+# import time binds them to whatever loop happens to be current.
+_playwright_lock: Optional[asyncio.Lock] = None
+
+
+def _is_playwright_shared() -> bool:
+    """
+    Check whether a single Playwright instance should be shared across scenarios.
+
+    Sharing is the default: starting Playwright spawns a node driver process
+    and pays a pipe handshake, which is pure overhead to repeat per scenario.
+    Set the `VEDRO_PW_SHARE_PLAYWRIGHT` environment variable to "0" or "false"
+    to opt out and start a fresh instance per scenario.
+
+    :return: True if the Playwright instance should be shared, False otherwise.
+    """
+    return os.environ.get("VEDRO_PW_SHARE_PLAYWRIGHT", "1").lower() not in ("0", "false")
+
+
 async def _get_playwright_instance(*, auto_close: bool = True) -> AsyncPlaywright:
     """
     Get a Playwright instance.
 
+    By default the Playwright instance (and its node driver process) is
+    started once, guarded by a lock so concurrent first calls cannot race,
+    and reused across scenarios with cleanup deferred to the end of the run.
+    When sharing is disabled a fresh instance is started per call.
+
     :param auto_close: Whether to automatically close the Playwright instance when
-                       the scenario ends.
+                       the scenario ends. Ignored when the instance is shared.
     :return: An AsyncPlaywright instance.
     """
-    playwright_manager = async_playwright()
-    playwright = await playwright_manager.start()
-    if auto_close:
-        defer(playwright_manager.__aexit__)
-    return playwright
+    global _shared_playwright, _playwright_lock
+    if _shared_playwright is not None:
+        return _shared_playwright
+
+    if not _is_playwright_shared():
+        playwright_manager = async_playwright()
+        playwright = await playwright_manager.start()
+        if auto_close:
+            defer(playwright_manager.__aexit__)
+        return playwright
+
+    if _playwright_lock is None:
+        _playwright_lock = asyncio.Lock()
+    async with _playwright_lock:
+        if _shared_playwright is None:
+            playwright_manager = async_playwright()
+            _shared_playwright = await playwright_manager.start()
+            defer_global(playwright_manager.__aexit__)
+    return _shared_playwright
@@ -1,24 +1,46 @@
+from __future__ import annotations
+
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Literal, Pattern, Sequence, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Pattern,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 if TYPE_CHECKING:
     from playwright._impl._api_structures import ClientCertificate
+    from playwright.async_api import (
+        FloatRect,
+        Geolocation,
+        HttpCredentials,
+        Locator,
+        ProxySettings,
+        StorageState,
+        ViewportSize,
+    )
 else:
-    from typing import Any
+    # These names only appear in annotations, which PEP 563 keeps as strings,
+    # so importing `playwright.async_api` (a heavy transitive graph) at
+    # runtime would be pure import-time cost for every process.
     ClientCertificate = Any
-
-from playwright.async_api import (
-    FloatRect,
-    Geolocation,
-    HttpCredentials,
-    Locator,
-    ProxySettings,
-    StorageState,
-    ViewportSize,
-)
+    FloatRect = Geolocation = HttpCredentials = Locator = Any
+    ProxySettings = StorageState = ViewportSize = Any
 
 __all__ = ("LaunchOptions", "ConnectOptions", "NewContextOptions", "DeviceOptions",
-           "TraceOptions", "VideoOptions", "ScreenshotOptions",)
+           "TraceOptions", "VideoOptions", "ScreenshotOptions",
+           "LAUNCH_OPTION_KEYS", "CONNECT_OPTION_KEYS", "NEW_CONTEXT_OPTION_KEYS",
+           "DEVICE_OPTION_KEYS", "TRACE_OPTION_KEYS", "VIDEO_OPTION_KEYS",
+           "SCREENSHOT_OPTION_KEYS", "LAUNCH_ONCE_KEYS",
+           "split_options", "freeze_options", "normalize_paths",)
 
 
 class LaunchOptions(TypedDict, total=False):
@@ -102,6 +124,12 @@ class ConnectOptions(TypedDict, total=False):
     expose_network: str
     """Defines network rules to expose from the client to the connected browser."""
 
+    prefer_cdp: bool
+    """
+    Connect over the Chrome DevTools Protocol (`connect_over_cdp`) instead of the
+    Playwright protocol. Chromium-only; `ws_endpoint` is used as the CDP endpoint.
+    """
+
 
 class NewContextOptions(TypedDict, total=False):
     """
@@ -430,3 +458,89 @@ class ScreenshotOptions(TypedDict, total=False):
     for creating repeatable screenshots. The stylesheet pierces the Shadow DOM
     and applies to inner frames as well.
     """
+
+
+# Valid key sets for each options TypedDict, computed once at import. Code
+# that filters or merges user-supplied option dicts can intersect against
+# these with C-level set operations instead of walking `__annotations__`
+# per call.
+LAUNCH_OPTION_KEYS = frozenset(LaunchOptions.__annotations__)
+CONNECT_OPTION_KEYS = frozenset(ConnectOptions.__annotations__)
+NEW_CONTEXT_OPTION_KEYS = frozenset(NewContextOptions.__annotations__)
+DEVICE_OPTION_KEYS = frozenset(DeviceOptions.__annotations__)
+TRACE_OPTION_KEYS = frozenset(TraceOptions.__annotations__)
+VIDEO_OPTION_KEYS = frozenset(VideoOptions.__annotations__)
+SCREENSHOT_OPTION_KEYS = frozenset(ScreenshotOptions.__annotations__)
+
+# Launch options that force a dedicated browser process. Everything else a
+# launch-per-scenario suite varies (proxy, timeouts, slow_mo) either exists
+# per context too or does not invalidate a shared browser, so a runner that
+# wants to reuse one browser only needs to key it by these fields.
+LAUNCH_ONCE_KEYS = LAUNCH_OPTION_KEYS - frozenset({"timeout", "slow_mo", "proxy"})
+
+
+def split_options(options: Mapping[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Partition a mixed options mapping into launch options and context options.
+
+    Lets callers collect browser settings in one dict and still reuse a
+    launched browser: the first dict keys the (cacheable) launch, the second
+    is passed to `new_context` per scenario. Keys present in both schemas
+    (such as `proxy`) go to the context dict, the per-scenario side.
+
+    :param options: The combined options to partition.
+    :return: A `(launch_options, context_options)` tuple of new dicts.
+    """
+    launch_options: Dict[str, Any] = {}
+    context_options: Dict[str, Any] = {}
+    for key, value in options.items():
+        if key in NEW_CONTEXT_OPTION_KEYS:
+            context_options[key] = value
+        else:
+            launch_options[key] = value
+    return launch_options, context_options
+
+
+def freeze_options(options: Any) -> Any:
+    """
+    Canonicalize an options value into a hashable form.
+
+    Option dicts cannot be dict keys or lru_cache arguments; this converts
+    mappings to sorted tuples of frozen `(key, value)` pairs and sequences to
+    tuples, recursively, so identically-shaped options freeze to equal keys.
+    Callers can then memoize expensive results (a launched browser, a created
+    context) per option shape.
+
+    :param options: The options value to freeze; scalars pass through unchanged.
+    :return: A hashable equivalent of the given value.
+    """
+    if isinstance(options, Mapping):
+        return tuple(sorted((key, freeze_options(value)) for key, value in options.items()))
+    if isinstance(options, (list, tuple)):
+        return tuple(freeze_options(item) for item in options)
+    return options
+
+
+# Option fields typed Union[str, Path] whose values Playwright fspath-coerces.
+# `storage_state` also accepts a path but may be a full state dict, so it is
+# deliberately left out.
+_PATH_FIELDS = frozenset({
+    "executable_path", "downloads_path", "traces_dir",
+    "record_har_path", "record_video_dir", "path",
+})
+
+
+def normalize_paths(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Coerce Path-valued option fields to plain strings, in place.
+
+    Playwright runs `os.fspath` on these values each time they are used;
+    normalizing once at the option boundary means repeated launches and
+    retries reuse one string instead of re-converting the Path every call.
+
+    :param options: The options dict to normalize.
+    :return: The same dict, with path fields coerced to `str`.
+    """
+    for key in _PATH_FIELDS & options.keys():
+        options[key] = os.fspath(options[key])
+    return options